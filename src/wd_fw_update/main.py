@@ -1,16 +1,26 @@
 import argparse
 import json
 import logging
+import os
+import re
+import shlex
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
 from shutil import which
 from tempfile import NamedTemporaryFile
-from typing import List
+from threading import Thread
+from typing import List, NoReturn, Optional, Tuple
 
-import inquirer
-import requests
+try:
+    # Prefer the C based lxml parser if it is installed.
+    from lxml.etree import fromstring, iterparse
+except ImportError:
+    from xml.etree.ElementTree import fromstring, iterparse
 
 from wd_fw_update import __name__ as package_name
 from wd_fw_update import __version__
@@ -23,6 +33,20 @@ _logger = logging.getLogger(__name__)
 
 BASE_WD_DOMAIN = "https://wddashboarddownloads.wdc.com/wdDashboard"
 DEVICE_LIST_URL = f"{BASE_WD_DOMAIN}/config/devices/lista_devices.xml"
+NVME_OUTPUT_SEPARATOR = "---SPLIT---"
+HTTP_TIMEOUT = 30
+# Firmware version of a fw properties url, i.e. the path component following firmware/<model>/.
+FW_VERSION_RE = re.compile(r"(?:^|/)firmware/[^/]+/([^/]+)/")
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+SYS_BLOCK_PATH = Path("/sys/block")
+# NVME controller name, e.g. "nvme0".
+CONTROLLER_RE = re.compile(r"nvme\d+")
+# Namespace part of an NVME device path, e.g. "n1" of "/dev/nvme0n1".
+NAMESPACE_SUFFIX_RE = re.compile(r"n\d+$")
+
+
+class UpdateAborted(Exception):
+    """Raised if the update process ends early without an error, e.g. if the user aborts it."""
 
 
 @dataclass
@@ -119,8 +143,9 @@ def setup_logging(loglevel: int) -> None:
     )
 
 
+@lru_cache(maxsize=None)
 def check_missing_dependencies() -> bool:
-    """Check for missing dependencies
+    """Check for missing dependencies. The result is cached for the lifetime of the process.
 
     Returns:
         is_missing (bool): True if any dependency is missing, False otherwise.
@@ -131,9 +156,10 @@ def check_missing_dependencies() -> bool:
 
 
 def print_info(drive=None) -> None:
-    """Print an overview of the NVME drive."""
+    """Print an overview of the NVME drive.
+    The drive properties have to be fetched beforehand, see :func:`get_model_properties`.
+    """
 
-    get_model_properties(drive=drive)
     print("========== Device Info ==========")
     for k, v in asdict(drive).items():
         k = k.replace("_", " ").ljust(25)
@@ -142,21 +168,54 @@ def print_info(drive=None) -> None:
     print()
 
 
+def get_controller(namespace: str) -> str:
+    """Returns the controller device of an NVME namespace.
+
+    The controller is resolved through sysfs. The namespace name can not be used for this:
+    with native NVME multipath, /dev/nvmeXnY is numbered after the subsystem, not the controller.
+    Only if sysfs is not available, the namespace suffix is stripped from the path.
+
+    Args:
+        namespace (str): NVME namespace path, e.g. "/dev/nvme0n1".
+
+    Returns:
+        controller (str): NVME controller path, e.g. "/dev/nvme0".
+    """
+    try:
+        parent = (SYS_BLOCK_PATH / os.path.basename(namespace) / "device").resolve(strict=True)
+
+        # Multipath namespaces belong to a subsystem, which links to all of its controllers.
+        if parent.name.startswith("nvme-subsys"):
+            controllers = [p.name for p in parent.iterdir() if CONTROLLER_RE.fullmatch(p.name)]
+        else:
+            controllers = [parent.name] if CONTROLLER_RE.fullmatch(parent.name) else []
+    except OSError:
+        controllers = []
+
+    if controllers:
+        return f"/dev/{min(controllers, key=lambda c: int(c[4:]))}"
+
+    _logger.debug(f"Could not resolve the controller of {namespace} via sysfs.")
+    return NAMESPACE_SUFFIX_RE.sub("", namespace)
+
+
 def get_devices() -> List[str]:
     """Returns a list of all NVME drives.
+    Namespaces are mapped to their controller, s.t. every drive is listed once.
 
     Returns:
-        devices (List[str]): List of NVME drives
+        devices (List[str]): List of NVME drives, e.g. ``["/dev/nvme0"]``
     """
     _logger.debug("Getting device list.")
 
     result = subprocess.run(
-        ["nvme", "list"],
+        ["nvme", "list", "--output-format=json"],
         shell=False,
         capture_output=True,
-        text=True,
+        check=True,
     )
-    devices = [d.split(" ", 1)[0] for d in result.stdout.split("\n")[2:] if d]
+    namespaces = [d["DevicePath"] for d in json.loads(result.stdout).get("Devices", [])]
+    devices = list(dict.fromkeys(get_controller(n) for n in namespaces))
     _logger.debug(f"Device list: {devices}\n")
     return devices
 
@@ -173,6 +232,7 @@ def ask_device(drive) -> None:
     Updates:
         drive.device (str): The selected device path.
     """
+    import inquirer
 
     devices = get_devices()
 
@@ -189,6 +249,44 @@ def ask_device(drive) -> None:
     drive.device = device
 
 
+@lru_cache(maxsize=16)
+def get_controller_info(device: str) -> dict:
+    """Read the controller identification and firmware log of an NVME device.
+    The result is cached per device and never invalidated. The firmware is only committed by
+    replacing the process (see :func:`commit_fw`), so a cached result can not become stale.
+
+    Args:
+        device (str): NVME device path.
+
+    Returns:
+        controller_info (dict): Parsed json output of ``nvme id-ctrl`` and ``nvme fw-log``,
+                                stored under the keys "id-ctrl" and "fw-log".
+    """
+    # Run id-ctrl and fw-log in a single sudo call to avoid a second sudo / nvme round trip.
+    quoted_device = shlex.quote(device)
+    result = subprocess.run(
+        [
+            "sudo",
+            "sh",
+            "-c",
+            f"nvme id-ctrl {quoted_device} --output-format=json"
+            f" && printf '\\n{NVME_OUTPUT_SEPARATOR}\\n'"
+            f" && nvme fw-log {quoted_device} --output-format=json",
+        ],
+        shell=False,
+        capture_output=True,
+        check=True,
+    )
+    # _logger.debug(result.stdout)
+    # json.loads accepts bytes, there is no need to decode the output first.
+    id_ctrl_output, fw_log_output = result.stdout.split(NVME_OUTPUT_SEPARATOR.encode(), 1)
+
+    return {
+        "id-ctrl": json.loads(id_ctrl_output),
+        "fw-log": json.loads(fw_log_output),
+    }
+
+
 def get_model_properties(drive) -> None:
     """Retrieve model properties for the specified NVME device.
 
@@ -209,36 +307,21 @@ def get_model_properties(drive) -> None:
     """
     _logger.info(f"Getting device properties of {drive.device}")
 
-    result = subprocess.run(
-        ["sudo", "nvme", "id-ctrl", drive.device, "--output-format=json"],
-        shell=False,
-        capture_output=True,
-        text=True,
-    )
-    # _logger.debug(result.stdout)
-    raw_properties = json.loads(result.stdout)
+    controller_info = get_controller_info(drive.device)
+    raw_properties = controller_info["id-ctrl"]
 
     drive.model = raw_properties["mn"].strip()
     drive.current_fw_version = raw_properties["fr"].strip()
 
     # Get slot information
-    frmw = bin(int(raw_properties["frmw"]))
-    frmw = frmw.lstrip("0b").rjust(8, "0")
+    frmw = int(raw_properties["frmw"])
 
-    drive.slot_1_readonly = bool(int(frmw[-1]))
-    drive.slot_count = int(frmw[-4:-1], 2)
-    drive.activation_without_reset = bool(int(frmw[-5]))
+    drive.slot_1_readonly = bool(frmw & 1)
+    drive.slot_count = (frmw >> 1) & 0b111
+    drive.activation_without_reset = bool((frmw >> 4) & 1)
 
     # Get current active slot
-    result = subprocess.run(
-        ["sudo", "nvme", "fw-log", drive.device, "--output-format=json"],
-        shell=False,
-        capture_output=True,
-        text=True,
-    )
-    # _logger.debug(result.stdout)
-
-    result = json.loads(result.stdout)
+    result = controller_info["fw-log"]
     result = list(result.values())[0]
 
     """
@@ -249,15 +332,13 @@ def get_model_properties(drive) -> None:
 
     - Bits 2:0  The firmware slot from which the actively running firmware revision was loaded.
     """
-    active_firmware_slot = int(result["Active Firmware Slot (afi)"])
-    active_firmware_slot = bin(active_firmware_slot).lstrip("0b").rjust(8, "0")
-    current_slot = int(active_firmware_slot[-2:], 2)
+    current_slot = int(result["Active Firmware Slot (afi)"]) & 0b111
     _logger.info(f"Current Active Firmware Slot: {current_slot}")
 
     slots_with_firmware = {}
     for k, v in result.items():
         if k.startswith("Firmware Rev Slot"):
-            k = int(k.lstrip("Firmware Rev Slot "))
+            k = int(k.rsplit(" ", 1)[1])
             slots_with_firmware[k] = v
 
     _logger.debug(f"Slots with Firmware: {slots_with_firmware}")
@@ -266,11 +347,213 @@ def get_model_properties(drive) -> None:
     drive.slots_with_firmware = slots_with_firmware
 
 
-def get_fw_url(drive: Drive) -> None:
+def probe_drive(device: str) -> Drive:
+    """Create a Drive object for the given device and fetch its properties.
+
+    Args:
+        device (str): NVME device path.
+
+    Returns:
+        drive (Drive): The Drive object with its model properties set.
+    """
+    drive = Drive(device=device)
+    get_model_properties(drive=drive)
+    return drive
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Returns the HTTP session shared by all requests.
+    All requests go to the same host, sharing one session reuses the TCP / TLS connection.
+
+    Returns:
+        session (requests.Session): The shared session.
+    """
+    # Imported lazily, s.t. e.g. `--help` / `--version` do not pay for the import.
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": f"wd_fw_update/{__version__}"})
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        ),
+    )
+    return session
+
+
+def get_cache_dir() -> Path:
+    """Returns the cache directory of wd_fw_update.
+
+    Returns:
+        cache_dir (Path): Path to the cache directory, honoring ``XDG_CACHE_HOME``.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / package_name
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a file by replacing it with a completely written temporary file.
+
+    Args:
+        path (Path): Destination file.
+        data (bytes): File content.
+    """
+    with NamedTemporaryFile(dir=path.parent, prefix=path.name, delete=False) as tmp_file:
+        try:
+            tmp_file.write(data)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+
+    os.replace(tmp_file.name, path)
+
+
+def download_device_list() -> Tuple[bytes, Optional[dict]]:
+    """Fetch the WD device list, using a conditional GET against the cached copy.
+    If the server answers with 304 Not Modified, the cached body is returned instead.
+    Nothing is written to the cache, see :func:`store_device_list`.
+
+    Returns:
+        xml (bytes): The raw device list xml.
+        meta (dict or None): ETag / Last-Modified of a newly downloaded list, None if it was cached.
+    """
+    cache_dir = get_cache_dir()
+
+    headers = {}
+    try:
+        meta = json.loads((cache_dir / "lista_devices.json").read_text())
+        cached_body = (cache_dir / "lista_devices.xml").read_bytes()
+    except (OSError, ValueError):
+        meta = {}
+        cached_body = None
+
+    if cached_body is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = get_session().get(DEVICE_LIST_URL, headers=headers, timeout=HTTP_TIMEOUT)
+
+    if response.status_code == 304 and cached_body is not None:
+        _logger.debug("Device list not modified, using cached copy.")
+        return cached_body, None
+
+    response.raise_for_status()
+
+    # requests asks for a compressed response by default, log whether the server made use of it.
+    _logger.debug(
+        f"Device list: {len(response.content)} bytes, "
+        f"Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}"
+    )
+
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return response.content, meta
+
+
+def store_device_list(xml: bytes, meta: dict) -> None:
+    """Cache the device list together with its ETag / Last-Modified headers.
+
+    Args:
+        xml (bytes): The raw device list xml.
+        meta (dict): ETag / Last-Modified headers as returned by :func:`download_device_list`.
+    """
+    cache_dir = get_cache_dir()
+    body_path = cache_dir / "lista_devices.xml"
+    meta_path = cache_dir / "lista_devices.json"
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Drop the old headers first, s.t. an interrupted write never pairs them with a new body.
+        meta_path.unlink(missing_ok=True)
+        write_atomic(body_path, xml)
+        write_atomic(meta_path, json.dumps(meta).encode())
+    except OSError as e:
+        _logger.warning(f"Could not cache the device list: {e}")
+
+
+def get_device_list() -> bytes:
+    """Fetch the WD device list and update the local cache.
+
+    Returns:
+        xml (bytes): The raw device list xml.
+    """
+    xml, meta = download_device_list()
+    if meta is not None:
+        store_device_list(xml, meta)
+    return xml
+
+
+def run_in_background(func, *args) -> Future:
+    """Run a function in a daemon thread.
+    Unlike a ThreadPoolExecutor, the thread does not delay the exit of the interpreter,
+    e.g. if the user aborts while a slow request is still running.
+
+    Args:
+        func (Callable): The function to run.
+        *args: Arguments passed to the function.
+
+    Returns:
+        future (Future): Future holding the result or exception of the function.
+    """
+    future = Future()
+
+    def target():
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    Thread(target=target, daemon=True).start()
+    return future
+
+
+def find_fw_urls(xml: bytes, model: str) -> Optional[List[str]]:
+    """Search the device list for the given model.
+    The xml is parsed incrementally and parsing stops at the first matching device.
+
+    Args:
+        xml (bytes): The raw device list xml.
+        model (str): Model name of the drive.
+
+    Returns:
+        relative_fw_urls (List[str] or None): List of all fw properties urls, None if the model is not listed.
+    """
+    root = None
+    for event, element in iterparse(BytesIO(xml.strip()), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+
+        if element.tag != "lista_device":
+            continue
+
+        if element.get("model") == model:
+            return [(u.text or "").strip() for u in element.findall("url")]
+
+        # Drop the already processed devices from the tree, s.t. only one device is kept in memory.
+        root.clear()
+
+    return None
+
+
+def get_fw_url(drive: Drive, device_list: Optional[bytes] = None) -> None:
     """Fetch firmware URL for the specified model from the device list.
 
     Args:
         drive (Drive): The Drive object.
+        device_list (bytes, optional): Already fetched device list xml.
+                                       If None, it is fetched using :func:`get_device_list`.
 
     Returns:
         None
@@ -280,17 +563,13 @@ def get_fw_url(drive: Drive) -> None:
     """
     _logger.debug("Getting firmware url.")
 
-    response = requests.get(DEVICE_LIST_URL)
-    response.raise_for_status()
-
-    xml = response.content.strip()
-    xml = ET.canonicalize(xml, strip_text=True)
-    xml_root = ET.fromstring(xml)
+    if device_list is None:
+        device_list = get_device_list()
 
-    for device in xml_root.findall("lista_device"):
-        if device.get("model") == drive.model:
-            drive.relative_fw_urls = [u.text for u in device.findall("url")]
-            return
+    relative_fw_urls = find_fw_urls(device_list, drive.model)
+    if relative_fw_urls is not None:
+        drive.relative_fw_urls = relative_fw_urls
+        return
 
     raise RuntimeError("No Firmware found for this model. Please check your selection / model.")
 
@@ -309,15 +588,18 @@ def ask_fw_version(drive, manual_mode: bool) -> None:
     Updates:
         drive.selected_version (str): Selected firmware version.
     """
+    import inquirer
+
     if not drive.relative_fw_urls:
         raise RuntimeError("No Firmware Version to select.")
 
     fw_version_int = drive.current_fw_version.removesuffix("WD")
 
-    fw_versions = []
-    for url in drive.relative_fw_urls:
-        v = url.split("/")[3]
+    # Several urls can point to the same version, keep the first occurrence only.
+    url_versions = [m.group(1) for m in map(FW_VERSION_RE.search, drive.relative_fw_urls) if m]
 
+    fw_versions = []
+    for v in dict.fromkeys(url_versions):
         # Add only versions newer than the current one to the list of available firmwares.
         if manual_mode or int(fw_version_int) < int(v.removesuffix("WD")):
             fw_versions.append(v)
@@ -326,10 +608,11 @@ def ask_fw_version(drive, manual_mode: bool) -> None:
 
     if not fw_versions:
         print_info(drive=drive)
-        print("No different / newer firmware version found.")
-        print("You are probably already on the latest version.")
-        print("If you believe this is a mistake, run `wd_fw_update -m` to enable manual mode.")
-        exit(0)
+        raise UpdateAborted(
+            "No different / newer firmware version found.\n"
+            "You are probably already on the latest version.\n"
+            "If you believe this is a mistake, run `wd_fw_update -m` to enable manual mode."
+        )
 
     questions = [
         inquirer.List(
@@ -355,6 +638,7 @@ def ask_slot(drive) -> None:
     Updates:
         drive.selected_slot (int): Selected slot number.
     """
+    import inquirer
 
     slots = list(range(1, drive.slot_count + 1))
 
@@ -383,7 +667,7 @@ def ask_slot(drive) -> None:
         ),
     ]
     slot = inquirer.prompt(questions)["slot"]
-    slot = int(slot[0])
+    slot = int(slot.split(":", 1)[0])
     drive.selected_slot = slot
 
 
@@ -397,8 +681,9 @@ def ask_mode(drive) -> None:
         None
 
     Updates:
-        drive.mode (int): Selected update mode.
+        drive.activation_mode (int): Selected update mode.
     """
+    import inquirer
 
     o0 = "0: Downloaded image replaces the image indicated by the Firmware Slot field. This image is not activated."
     o1 = "1: Downloaded image replaces the image indicated by the Firmware Slot field. This image is activated at the next reset."
@@ -420,7 +705,7 @@ def ask_mode(drive) -> None:
     ]
     mode = inquirer.prompt(questions)["mode"]
     mode = int(mode[0])
-    drive.mode = mode
+    drive.activation_mode = mode
 
 
 def get_upgrade_url(drive, manual_mode: bool) -> None:
@@ -443,14 +728,13 @@ def get_upgrade_url(drive, manual_mode: bool) -> None:
 
     _logger.debug(f"Firmware properties url: {prop_url}")
 
-    response = requests.get(prop_url)
+    response = get_session().get(prop_url, timeout=HTTP_TIMEOUT)
     response.raise_for_status()
 
-    xml = response.content.strip()
-    xml = ET.canonicalize(xml, strip_text=True)
-    xml_root = ET.fromstring(xml)
+    # Parse once and strip the texts afterwards, instead of canonicalizing the xml beforehand.
+    xml_root = fromstring(response.content.strip())
 
-    dependencies_list = [dep.text for dep in xml_root.findall("dependency")]
+    dependencies_list = [(dep.text or "").strip() for dep in xml_root.findall("dependency")]
 
     _logger.debug(f"Firmware dependencies: {dependencies_list}")
 
@@ -462,28 +746,25 @@ def get_upgrade_url(drive, manual_mode: bool) -> None:
         print("If you believe this is a mistake, run `wd_fw_update -m` to enable manual mode.")
         exit(1)
 
-    firmware_url = f"{base_url}/{xml_root.findtext('fwfile')}"
+    firmware_url = f"{base_url}/{xml_root.findtext('fwfile', '').strip()}"
 
     _logger.debug(f"Firmware file url: {firmware_url}\n")
     drive.firmware_url = firmware_url
 
 
 def update_fw(drive) -> bool:
-    """Update firmware for the specified NVME device
+    """Download the firmware and load it onto the specified NVME device.
+    The firmware is not committed, see :func:`commit_fw`.
 
     Args:
-        current_fw_version (str): Current firmware version.
-        version (str): Firmware version to be installed.
-        firmware_url (str): URL to new firmware file.
-        model (str): Model name.
-        device (str): NVME device identifier.
-        current_slot (int): Current active firmware slot.
-        slot (int): Selected firmware slot.
-        mode (int): Selected update mode.
+        drive (Drive): The Drive object.
 
     Returns:
         success (bool): Success status.
     """
+    import inquirer
+    from requests.exceptions import RequestException
+
     _logger.info("Downloading firmware.")
 
     with NamedTemporaryFile(
@@ -495,11 +776,31 @@ def update_fw(drive) -> bool:
         drive.tmp_fw_file_name = fw_file.name
 
         try:
-            r = requests.get(drive.firmware_url)
-            r.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            fw_file.write(r.content)
-
-        except requests.exceptions.RequestException as e:
+            # Stream the firmware to disk instead of holding the whole file in memory.
+            with get_session().get(drive.firmware_url, stream=True, timeout=HTTP_TIMEOUT) as r:
+                r.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+
+                # iter_content wraps connection / decoding errors into RequestException.
+                size = 0
+                for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    fw_file.write(chunk)
+                    size += len(chunk)
+
+                # Never hand a truncated firmware file to nvme. Content-Length refers to the
+                # encoded body, so it can only be compared if the response is not compressed.
+                expected_size = r.headers.get("Content-Length")
+                if (
+                    expected_size is not None
+                    and "Content-Encoding" not in r.headers
+                    and size != int(expected_size)
+                ):
+                    raise RequestException(f"Received {size} of {expected_size} bytes.")
+
+            # nvme-cli reads the file through the page cache, flushing is enough. Forcing it to
+            # disk with fsync would only add a synchronous write.
+            fw_file.flush()
+
+        except RequestException as e:
             _logger.error(f"Error downloading firmware: {e}")
             print(f"Error downloading firmware: {e}")
             exit(1)
@@ -516,7 +817,7 @@ def update_fw(drive) -> bool:
         print(f"Firmware Version:  {drive.current_fw_version} --> {drive.selected_version}")
         print(f"Installation Slot: {drive.selected_slot}")
         print(f"Active Slot:       {drive.current_slot} --> {drive.selected_slot}")
-        print(f"Activation Mode:   {drive.mode}")
+        print(f"Activation Mode:   {drive.activation_mode}")
         print(f"Temporary File:    {drive.tmp_fw_file_name}\n\n")
 
         questions = [
@@ -526,8 +827,7 @@ def update_fw(drive) -> bool:
         answer = inquirer.prompt(questions)["continue"]
 
         if not answer:
-            print("Aborted.")
-            exit(0)
+            raise UpdateAborted("Aborted.")
 
         _logger.info("Loading the firmware file.")
 
@@ -546,26 +846,6 @@ def update_fw(drive) -> bool:
         _logger.debug(result)
         _logger.info(f"NVME Download returncode: {result.returncode}")
 
-        if not result.returncode == 0:
-            return False
-
-        _logger.info("Commiting / Switching to the firmware file.")
-        result = subprocess.run(
-            [
-                "sudo",
-                "nvme",
-                "fw-commit",
-                drive.device,
-                f"-s {drive.selected_slot}",
-                f"-a {drive.mode}",
-            ],
-            shell=False,
-            capture_output=True,
-            text=True,
-        )
-        _logger.debug(result)
-        _logger.info(f"NVME Commit returncode: {result.returncode}")
-
     if result.returncode == 0:
         return True
     else:
@@ -573,6 +853,44 @@ def update_fw(drive) -> bool:
         return False
 
 
+def commit_fw(drive) -> NoReturn:
+    """Commit / switch to the downloaded firmware. This function does not return.
+
+    The Python process is replaced by ``sudo nvme fw-commit`` using :func:`os.execvp`, s.t.
+    the interpreter does not stay resident while the drive activates the new firmware.
+    The exit status of the commit becomes the exit status of wd_fw_update.
+
+    Args:
+        drive (Drive): The Drive object.
+    """
+    _logger.info("Commiting / Switching to the firmware file.")
+
+    if drive.activation_mode == 0:
+        print("Once the commit succeeded, don't forget to switch to the new slot.")
+    elif drive.activation_mode == 1 or drive.activation_mode == 2:
+        print("Once the commit succeeded, please reboot.")
+    elif drive.activation_mode == 3:
+        print("Once the commit succeeded, the drive runs the new version.")
+
+    _logger.info("[END of script]")
+
+    # Buffered output would be lost when the process image is replaced.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    os.execvp(
+        "sudo",
+        [
+            "sudo",
+            "nvme",
+            "fw-commit",
+            drive.device,
+            f"-s{drive.selected_slot}",
+            f"-a{drive.activation_mode}",
+        ],
+    )
+
+
 def wd_fw_update(manual_mode):
     """Updates the firmware of Western Digital SSDs on Ubuntu / Linux Mint.
     The user will be prompted for version / model / slot selection.
@@ -590,13 +908,21 @@ def wd_fw_update(manual_mode):
 
     drive = Drive()
 
+    # The device list does not depend on the drive, download it while the user is selecting one.
+    # Writing the cache may log a warning, so it is done on the main thread after the prompt.
+    download = run_in_background(download_device_list)
+
     # Step 1: Get model number and firmware version
     ask_device(drive=drive)
 
     # Step 2: Fetch the device list and find the firmware URL
     get_model_properties(drive=drive)
 
-    get_fw_url(drive=drive)
+    device_list, meta = download.result()
+    if meta is not None:
+        store_device_list(device_list, meta)
+
+    get_fw_url(drive=drive, device_list=device_list)
 
     # Step 3: Check firmware version and dependencies
     ask_fw_version(drive=drive, manual_mode=manual_mode)
@@ -610,21 +936,15 @@ def wd_fw_update(manual_mode):
     # Step 6: Ask for installation mode
     ask_mode(drive=drive)
 
-    # Step 7: Download and install the firmware file
+    # Step 7: Download the firmware file and load it onto the drive
     result = update_fw(drive)
 
-    if result:
-        if drive.mode == 0:
-            print("Update complete. Don't forget to switch to the new slot.")
-        elif drive.mode == 1 or drive.mode == 2:
-            print("Update complete. Please reboot.")
-        elif drive.mode == 3:
-            print("Update complete. Switched to the new version.")
-    else:
+    if not result:
         print("An error happened during the update process.")
         raise RuntimeError("Please try again with caution.")
 
-    _logger.info("Firmware update process completed.")
+    # Step 8: Commit the firmware, this replaces the current process.
+    commit_fw(drive)
 
 
 def main(args):
@@ -643,16 +963,23 @@ def main(args):
 
     if args.info:
         devices = get_devices()
-        for d in devices:
-            drive = Drive()
-            drive.device = d
-            print_info(drive=drive)
 
-        exit()
+        if devices:
+            # Ask for the sudo password once, otherwise every probe thread would prompt for it.
+            subprocess.run(["sudo", "-v"], check=True)
 
-    wd_fw_update(args.manual)
+            # Probe all drives concurrently, but print them in the original order.
+            with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+                for drive in executor.map(probe_drive, devices):
+                    print_info(drive=drive)
 
-    _logger.info("[END of script]")
+        exit()
+
+    try:
+        wd_fw_update(args.manual)
+    except UpdateAborted as e:
+        print(e)
+        sys.exit(0)
 
 
 def run():